@@ -3,8 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from functools import partial
 from itertools import chain
-from collections.abc import Iterable
 import logging
 import ssl
 from typing import Any
@@ -16,7 +16,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import ATTR_DEVICE_ID, ATTR_ENTITY_ID, ATTR_SUGGESTED_AREA, CONF_HOST, Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 import homeassistant.helpers.config_validation as cv
@@ -42,6 +42,8 @@ from .const import (
     DOMAIN,
     LUTRON_CASETA_BUTTON_EVENT,
     MANUFACTURER,
+    QSX_KEYPADS,
+    SEETOUCH_BUTTON_NAME_OVERRIDES,
     UNASSIGNED_AREA,
 )
 from .device_trigger import (
@@ -50,7 +52,7 @@ from .device_trigger import (
     _lutron_model_to_device_type,
 )
 from .models import LutronCasetaData
-from .util import serial_to_unique_id
+from .util import area_and_name_from_name, serial_to_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -88,11 +90,6 @@ ATTR_BUTTON_GROUPS = "button_groups"
 ATTR_BUTTON_GROUP = "button_group"
 ATTR_BUTTON_NAME = "button_name"
 
-SEETOUCH_BUTTON_NAME_LOWER = "Button 18"
-SEETOUCH_BUTTON_NAME_RAISE = "Button 19"
-
-QSX_KEYPADS = {'SeeTouchHybridKeypad', 'HomeownerKeypad', 'SeeTouchTabletopKeypad', 'Pico3ButtonRaiseLower'}
-
 async def async_setup(hass: HomeAssistant, base_config: ConfigType) -> bool:
     """Set up the Lutron component."""
     hass.data.setdefault(DOMAIN, {})
@@ -118,11 +115,12 @@ async def async_setup(hass: HomeAssistant, base_config: ConfigType) -> bool:
 
 
 async def _async_migrate_unique_ids(
-    hass: HomeAssistant, entry: config_entries.ConfigEntry
+    hass: HomeAssistant,
+    entry: config_entries.ConfigEntry,
+    dev_reg: dr.DeviceRegistry,
 ) -> None:
     """Migrate entities since the occupancygroup were not actually unique."""
 
-    dev_reg = dr.async_get(hass)
     bridge_unique_id = entry.unique_id
 
     @callback
@@ -177,7 +175,9 @@ async def async_setup_entry(
             raise ConfigEntryNotReady(f"Cannot connect to {host}")
 
     _LOGGER.debug("Connected to Lutron Caseta bridge via LEAP at %s", host)
-    await _async_migrate_unique_ids(hass, config_entry)
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    await _async_migrate_unique_ids(hass, config_entry, dev_reg)
 
     devices = bridge.get_devices()
     bridge_device = devices[BRIDGE_DEVICE_ID]
@@ -190,24 +190,32 @@ async def async_setup_entry(
 
     button_group_to_device_map: dict[str, dict] = {}
     for device in devices.values():
-        if ATTR_BUTTON_GROUPS in device and isinstance(device[ATTR_BUTTON_GROUPS], Iterable):
-            for g in device[ATTR_BUTTON_GROUPS]:
-                if g not in button_group_to_device_map:
-                    button_group_to_device_map[g] = device
+        if isinstance(groups := device.get(ATTR_BUTTON_GROUPS), (list, tuple, set)):
+            for g in groups:
+                button_group_to_device_map.setdefault(g, device)
 
-    _LOGGER.debug(f"button_group_to_device_map: {button_group_to_device_map}")
+    _LOGGER.debug("button_group_to_device_map: %s", button_group_to_device_map)
 
-    _async_register_bridge_device(hass, entry_id, bridge_device)
+    _async_register_bridge_device(dev_reg, entry_id, bridge_device)
     button_devices = _async_register_button_devices(
-        hass, entry_id, bridge_device, buttons, button_group_to_device_map
+        dev_reg, entry_id, bridge_device, buttons, button_group_to_device_map
     )
 
-    _async_subscribe_pico_remote_events(hass, bridge, buttons, button_group_to_device_map)
+    for unsub in _async_subscribe_pico_remote_events(
+        hass, dev_reg, ent_reg, bridge, buttons, button_group_to_device_map
+    ):
+        config_entry.async_on_unload(unsub)
 
     # Store this bridge (keyed by entry_id) so it can be retrieved by the
     # platforms we're setting up.
     hass.data[DOMAIN][entry_id] = LutronCasetaData(
-        bridge, bridge_device, button_devices
+        bridge,
+        bridge_device,
+        devices,
+        buttons,
+        bridge.occupancy_groups,
+        button_devices,
+        button_group_to_device_map,
     )
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
@@ -217,10 +225,9 @@ async def async_setup_entry(
 
 @callback
 def _async_register_bridge_device(
-    hass: HomeAssistant, config_entry_id: str, bridge_device: dict
+    device_registry: dr.DeviceRegistry, config_entry_id: str, bridge_device: dict
 ) -> None:
     """Register the bridge device in the device registry."""
-    device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
         name=bridge_device["name"],
         manufacturer=MANUFACTURER,
@@ -233,42 +240,44 @@ def _async_register_bridge_device(
 
 @callback
 def _async_register_button_devices(
-    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
     config_entry_id: str,
     bridge_device,
     button_devices_by_id: dict[int, dict],
     button_group_to_device_map: dict[str, dict]
 ) -> dict[str, dict]:
     """Register button devices (Pico Remotes) in the device registry."""
-    device_registry = dr.async_get(hass)
     button_devices_by_dr_id: dict[str, dict] = {}
     seen = set()
+    via_device = (DOMAIN, bridge_device[ATTR_SERIAL])
 
     for device in button_devices_by_id.values():
-        if ATTR_SERIAL not in device and ATTR_BUTTON_GROUP in device:
-            device[ATTR_SERIAL] = int(device[ATTR_BUTTON_GROUP])
-        
-        if device[ATTR_SERIAL] in seen:
+        if ATTR_SERIAL in device:
+            serial = device[ATTR_SERIAL]
+        else:
+            serial = device[ATTR_SERIAL] = int(device[ATTR_BUTTON_GROUP])
+
+        if serial in seen:
             continue
-        seen.add(device[ATTR_SERIAL])
+        seen.add(serial)
 
-        _LOGGER.debug(f"_async_register_button_devices: {device}")
+        _LOGGER.debug("_async_register_button_devices: %s", device)
         if device['type'] in QSX_KEYPADS:
             # Homeworks Keypad Handling
             button_group = device[ATTR_BUTTON_GROUP]
             parent_device = button_group_to_device_map[button_group]
             hass_device_id = parent_device[ATTR_DEVICE_ID]
         else:
-            hass_device_id = device[ATTR_SERIAL]
+            hass_device_id = serial
 
-        area, name = _area_and_name_from_name(device["name"])
+        area, name = area_and_name_from_name(device["name"])
         device_args: dict[str, Any] = {
             "name": f"{area} {name}",
             "manufacturer": MANUFACTURER,
             "config_entry_id": config_entry_id,
             "identifiers": {(DOMAIN, hass_device_id)},
             "model": f"{device['model']} ({device['type']})",
-            "via_device": (DOMAIN, bridge_device[ATTR_SERIAL]),
+            "via_device": via_device,
         }
         if area != UNASSIGNED_AREA:
             device_args["suggested_area"] = area
@@ -279,63 +288,63 @@ def _async_register_button_devices(
     return button_devices_by_dr_id
 
 
-def _area_and_name_from_name(device_name: str) -> tuple[str, str]:
-    """Return the area and name from the devices internal name."""
-    if "_" in device_name:
-        area_device_name = device_name.split("_", 1)
-        return area_device_name[0], area_device_name[1]
-    return UNASSIGNED_AREA, device_name
+_LIP_CACHE: dict[str, dict[int, int]] = {}
 
 
-@callback
-def async_get_lip_button(device_type: str, leap_button: int) -> int | None:
-    """Get the LIP button for a given LEAP button."""
+def _build_leap_to_lip_map(device_type: str) -> dict[int, int]:
+    """Compose the LEAP to LIP button number mapping for a device type."""
     if (
         lip_buttons_name_to_num := DEVICE_TYPE_SUBTYPE_MAP_TO_LIP.get(device_type)
     ) is None or (
         leap_button_num_to_name := LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP.get(device_type)
     ) is None:
-        return None
-    return lip_buttons_name_to_num[leap_button_num_to_name[leap_button]]
+        return {}
+    return {
+        leap_button: lip_buttons_name_to_num[name]
+        for leap_button, name in leap_button_num_to_name.items()
+        if name in lip_buttons_name_to_num
+    }
+
+
+@callback
+def async_get_lip_button(device_type: str, leap_button: int) -> int | None:
+    """Get the LIP button for a given LEAP button."""
+    if (leap_to_lip := _LIP_CACHE.get(device_type)) is None:
+        leap_to_lip = _LIP_CACHE[device_type] = _build_leap_to_lip_map(device_type)
+    return leap_to_lip.get(leap_button)
 
 
 @callback
 def _async_subscribe_pico_remote_events(
     hass: HomeAssistant,
+    dev_reg: dr.DeviceRegistry,
+    ent_reg: er.EntityRegistry,
     bridge_device: Smartbridge,
     button_devices_by_id: dict[int, dict],
     button_group_to_device_map: dict[str, dict]
-):
+) -> list[CALLBACK_TYPE]:
     """Subscribe to lutron events."""
-    dev_reg = dr.async_get(hass)
-    ent_reg = er.async_get(hass)
+    # Everything except the action is fixed for a given button, so the
+    # event payload (including the registry ids) is built on the first
+    # press and reused until the device or entity registry changes.
+    precomputed: dict[int, dict[str, Any]] = {}
 
     @callback
-    def _async_button_event(button_id, event_type):
-        if not (device := button_devices_by_id.get(button_id)):
-            return
-
-        if event_type == BUTTON_STATUS_PRESSED:
-            action = ACTION_PRESSED
-        else:
-            action = ACTION_RELEASED
-
+    def _async_build_button_payload(button_id, device) -> dict[str, Any]:
         type_ = _lutron_model_to_device_type(device["model"], device["type"])
-        area, name = _area_and_name_from_name(device["name"])
+        area, name = area_and_name_from_name(device["name"])
         leap_button_number = device["button_number"]
         lip_button_number = async_get_lip_button(type_, leap_button_number)
 
         if device['type'] in QSX_KEYPADS:
-            # Homeworks Keypad Handling
+            # Homeworks Keypad Handling; the keypad's device id and
+            # control station name are resolved here once per button.
             button_group = device[ATTR_BUTTON_GROUP]
             parent_device = button_group_to_device_map[button_group]
             hass_device_id = parent_device[ATTR_DEVICE_ID]
-            area, name = _area_and_name_from_name(parent_device[ATTR_CONTROL_STATION_NAME])
+            area, name = area_and_name_from_name(parent_device[ATTR_CONTROL_STATION_NAME])
             button_name = device[ATTR_BUTTON_NAME]
-            if button_name == SEETOUCH_BUTTON_NAME_LOWER:
-                button_name = "Lower"
-            elif button_name == SEETOUCH_BUTTON_NAME_RAISE:
-                button_name = "Raise"
+            button_name = SEETOUCH_BUTTON_NAME_OVERRIDES.get(button_name, button_name)
         else:
             hass_device_id = device["serial"]
             button_name = f"button_{leap_button_number}"
@@ -344,30 +353,57 @@ def _async_subscribe_pico_remote_events(
         hass_entity_id = ent_reg.async_get_entity_id(
             Platform.BUTTON, DOMAIN, button_id)
 
-        hass.bus.async_fire(
-            LUTRON_CASETA_BUTTON_EVENT,
-            {
-                ATTR_SERIAL: hass_device_id,
-                ATTR_TYPE: type_,
-                ATTR_BUTTON_NUMBER: lip_button_number,
-                ATTR_BUTTON_NAME: button_name,
-                ATTR_LEAP_BUTTON_NUMBER: leap_button_number,
-                ATTR_DEVICE_NAME: name,
-                ATTR_DEVICE_ID: hass_device.id,
-                ATTR_AREA_NAME: area,
-                ATTR_ACTION: action,
-                ATTR_ENTITY_ID: hass_entity_id,
-            },
-        )
+        payload = precomputed[button_id] = {
+            ATTR_SERIAL: hass_device_id,
+            ATTR_TYPE: type_,
+            ATTR_BUTTON_NUMBER: lip_button_number,
+            ATTR_BUTTON_NAME: button_name,
+            ATTR_LEAP_BUTTON_NUMBER: leap_button_number,
+            ATTR_DEVICE_NAME: name,
+            ATTR_DEVICE_ID: hass_device.id,
+            ATTR_AREA_NAME: area,
+            ATTR_ENTITY_ID: hass_entity_id,
+        }
+        return payload
+
+    @callback
+    def _async_button_event(button_id, event_type):
+        if not (payload := precomputed.get(button_id)):
+            if not (device := button_devices_by_id.get(button_id)):
+                return
+            payload = _async_build_button_payload(button_id, device)
+
+        event_data = payload.copy()
+        if event_type == BUTTON_STATUS_PRESSED:
+            event_data[ATTR_ACTION] = ACTION_PRESSED
+        else:
+            event_data[ATTR_ACTION] = ACTION_RELEASED
+
+        hass.bus.async_fire(LUTRON_CASETA_BUTTON_EVENT, event_data)
 
     for button_id in button_devices_by_id:
         bridge_device.add_button_subscriber(
-            str(button_id),
-            lambda event_type, button_id=button_id: _async_button_event(
-                button_id, event_type
-            ),
+            str(button_id), partial(_async_button_event, button_id)
         )
 
+    @callback
+    def _async_device_registry_updated(event: Event) -> None:
+        precomputed.clear()
+
+    @callback
+    def _async_entity_registry_updated(event: Event) -> None:
+        if event.data[ATTR_ENTITY_ID].startswith(f"{Platform.BUTTON}."):
+            precomputed.clear()
+
+    return [
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, _async_device_registry_updated
+        ),
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated
+        ),
+    ]
+
 
 async def async_unload_entry(
     hass: HomeAssistant, entry: config_entries.ConfigEntry
@@ -396,18 +432,23 @@ class LutronCasetaDevice(Entity):
         self._device = device
         self._smartbridge = bridge
         self._bridge_device = bridge_device
+        self._attr_extra_state_attributes = {
+            "device_id": self.device_id,
+            "zone_id": device.get("zone", "1"),
+        }
 
         if "serial" not in self._device:
             return
 
         self._bridge_unique_id = serial_to_unique_id(bridge_device["serial"])
-        area, name = _area_and_name_from_name(device["name"])
+        area, name = area_and_name_from_name(device["name"])
 
+        self._resolved_serial = self._handle_none_serial(device["serial"])
         self.display_name = f"{area} {name}"
         self._attr_name = self.display_name
-        self._attr_unique_id = self.serial
+        self._attr_unique_id = str(self._resolved_serial)
         info = DeviceInfo(
-            identifiers={(DOMAIN, self._handle_none_serial(self.serial))},
+            identifiers={(DOMAIN, self._resolved_serial)},
             manufacturer=MANUFACTURER,
             model=f"{device['model']} ({device['type']})",
             name=self.display_name,
@@ -418,10 +459,6 @@ class LutronCasetaDevice(Entity):
             info[ATTR_SUGGESTED_AREA] = area
         self._attr_device_info = info
 
-    @property
-    def name(self):
-        return self.display_name
-
     async def async_added_to_hass(self):
         """Register callbacks."""
         self._smartbridge.add_subscriber(self.device_id, self.async_write_ha_state)
@@ -445,17 +482,6 @@ class LutronCasetaDevice(Entity):
         """Return the serial number of the device."""
         return self._device["serial"]
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the device (serial)."""
-        return str(self._handle_none_serial(self.serial))
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        zone=self._device.get("zone", "1")
-        return {"device_id": self.device_id, "zone_id": zone}
-
 
 class LutronCasetaDeviceUpdatableEntity(LutronCasetaDevice):
     """A lutron_caseta entity that can update by syncing data from the bridge."""
@@ -476,30 +502,26 @@ async def async_remove_config_entry_device(
 ) -> bool:
     """Remove lutron_caseta config entry from a device."""
     data: LutronCasetaData = hass.data[DOMAIN][entry.entry_id]
-    bridge = data.bridge
-    devices = bridge.get_devices()
-    buttons = bridge.buttons
-    occupancy_groups = bridge.occupancy_groups
-    bridge_device = devices[BRIDGE_DEVICE_ID]
-    bridge_unique_id = serial_to_unique_id(bridge_device["serial"])
-    all_identifiers: set[tuple[str, str]] = {
-        # Base bridge
-        _id_to_identifier(bridge_unique_id),
-        # Motion sensors and occupancy groups
-        *(
-            _id_to_identifier(
-                f"occupancygroup_{bridge_unique_id}_{device['occupancy_group_id']}"
-            )
-            for device in occupancy_groups.values()
-        ),
-        # Button devices such as pico remotes and all other devices
-        *(
-            _id_to_identifier(device["serial"])
-            for device in chain(devices.values(), buttons.values())
-        ),
-    }
-    return not any(
-        identifier
-        for identifier in device_entry.identifiers
-        if identifier in all_identifiers
+    devices = data.devices
+    buttons = data.buttons
+    occupancy_groups = data.occupancy_groups
+    bridge_unique_id = serial_to_unique_id(data.bridge_device["serial"])
+    all_identifiers: frozenset[tuple[str, str]] = frozenset(
+        chain(
+            # Base bridge
+            (_id_to_identifier(bridge_unique_id),),
+            # Motion sensors and occupancy groups
+            (
+                _id_to_identifier(
+                    f"occupancygroup_{bridge_unique_id}_{device['occupancy_group_id']}"
+                )
+                for device in occupancy_groups.values()
+            ),
+            # Button devices such as pico remotes and all other devices
+            (
+                _id_to_identifier(device["serial"])
+                for device in chain(devices.values(), buttons.values())
+            ),
+        )
     )
+    return device_entry.identifiers.isdisjoint(all_identifiers)
@@ -4,7 +4,6 @@ from pylutron_caseta.smartbridge import Smartbridge
 
 from typing import Any, Dict
 import logging
-from collections.abc import Iterable
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -18,13 +17,16 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from homeassistant.const import ATTR_MODEL, ATTR_MANUFACTURER, ATTR_SUGGESTED_AREA, ATTR_NAME, ATTR_IDENTIFIERS, ATTR_DEVICE_ID
 
-from . import DOMAIN as CASETA_DOMAIN, LutronCasetaDevice, _area_and_name_from_name
+from . import DOMAIN as CASETA_DOMAIN, LutronCasetaDevice
 from .const import CONFIG_URL, MANUFACTURER
 from .models import LutronCasetaData
+from .util import area_and_name_from_name
 
 from .const import (
     DOMAIN,
     MANUFACTURER,
+    SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN,
+    SEETOUCH_BUTTON_NAME_OVERRIDES,
     UNASSIGNED_AREA,
 )
 
@@ -34,13 +36,10 @@ _LOGGER = logging.getLogger(__name__)
 ATTR_BUTTON_NAME = "button_name"
 ATTR_BUTTON_LED = "button_led"
 ATTR_CONTROL_STATION_NAME = "control_station_name"
-ATTR_BUTTON_GROUPS = "button_groups"
 ATTR_BUTTON_GROUP = "button_group"
 ATTR_TYPE = "type"
 
-SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN = "Button "
-SEETOUCH_BUTTON_NAME_LOWER = "Button 18"
-SEETOUCH_BUTTON_NAME_RAISE = "Button 19"
+SEETOUCH_RAISE_LOWER_BUTTON_NAMES = frozenset(SEETOUCH_BUTTON_NAME_OVERRIDES)
 
 
 async def async_setup_entry(
@@ -57,42 +56,32 @@ async def async_setup_entry(
     bridge = data.bridge
     bridge_device = data.bridge_device
     occupancy_groups = bridge.occupancy_groups
-    async_add_entities(
+    entities: list[BinarySensorEntity] = [
         LutronOccupancySensor(occupancy_group, bridge, bridge_device)
         for occupancy_group in occupancy_groups.values()
-    )
+    ]
 
-    buttons = bridge.buttons
     devices = bridge.devices
+    button_group_to_device_map = data.button_group_to_device_map
 
-    button_group_to_device_map = {}
-    for device in devices.values():
-        if ATTR_BUTTON_GROUPS in device and isinstance(device[ATTR_BUTTON_GROUPS], Iterable):
-            for g in device[ATTR_BUTTON_GROUPS]:
-                if g not in button_group_to_device_map:
-                    button_group_to_device_map[g] = device
+    for button_data in bridge.buttons.values():
+        if (keypad_led_device_id := button_data.get(ATTR_BUTTON_LED)) is not None:
+            _LOGGER.debug("async_setup_entry button_led: button_data=%s", button_data)
 
-    led_entities = []
-    for device_id in buttons:
-        button_data = buttons[device_id]
-        if ATTR_BUTTON_LED in button_data and button_data[ATTR_BUTTON_LED] is not None:
-            _LOGGER.debug(f"async_setup_entry button_led: button_data={button_data}")
-
-            keypad_led_device_id = button_data[ATTR_BUTTON_LED]
             keypad_led_device = devices[keypad_led_device_id]
 
-            button_name = button_data[ATTR_BUTTON_NAME]
-            if button_name not in [SEETOUCH_BUTTON_NAME_LOWER, SEETOUCH_BUTTON_NAME_RAISE]:
-                button = LutronCasetaButtonLED(
-                    keypad_led_device,
-                    button_data,
-                    bridge, 
-                    bridge_device,
-                    button_group_to_device_map[button_data[ATTR_BUTTON_GROUP]])
-                led_entities.append(button)
-
-    async_add_entities(led_entities)
+            if button_data[ATTR_BUTTON_NAME] not in SEETOUCH_RAISE_LOWER_BUTTON_NAMES:
+                entities.append(
+                    LutronCasetaButtonLED(
+                        keypad_led_device,
+                        button_data,
+                        bridge,
+                        bridge_device,
+                        button_group_to_device_map[button_data[ATTR_BUTTON_GROUP]],
+                    )
+                )
 
+    async_add_entities(entities)
 
 
 class LutronOccupancySensor(LutronCasetaDevice, BinarySensorEntity):
@@ -103,8 +92,9 @@ class LutronOccupancySensor(LutronCasetaDevice, BinarySensorEntity):
     def __init__(self, device, bridge, bridge_device):
         """Init an occupancy sensor."""
         super().__init__(device, bridge, bridge_device)
-        _, name = _area_and_name_from_name(device["name"])
+        _, name = area_and_name_from_name(device["name"])
         self._attr_name = name
+        self._attr_extra_state_attributes = {"device_id": self.device_id}
         self._attr_device_info = DeviceInfo(
             identifiers={(CASETA_DOMAIN, self.unique_id)},
             manufacturer=MANUFACTURER,
@@ -136,11 +126,6 @@ class LutronOccupancySensor(LutronCasetaDevice, BinarySensorEntity):
         """Return a unique identifier."""
         return f"occupancygroup_{self._bridge_unique_id}_{self.device_id}"
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {"device_id": self.device_id}
-
 
 class LutronCasetaButtonLED(BinarySensorEntity):
     """Representation of a Lutron Caseta button."""
@@ -162,20 +147,20 @@ class LutronCasetaButtonLED(BinarySensorEntity):
 
         button_name = button_device[ATTR_BUTTON_NAME]
 
-        if SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN in button_name:
+        if button_name.startswith(SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN):
             # Hide default buttons
             self._attr_entity_registry_enabled_default = False
         else:
             self._attr_entity_registry_enabled_default = True
 
         button_device_name = button_device[ATTR_NAME]
-        area, _ = _button_area_and_name_from_name(button_device_name)
+        area, _ = area_and_name_from_name(button_device_name)
 
         self.display_name = f"{area} {button_name} LED"
         self._attr_name = self.display_name
         self._attr_unique_id = self.device_id
 
-        parent_area, parent_name = _button_area_and_name_from_name(parent_device[ATTR_CONTROL_STATION_NAME])
+        parent_area, parent_name = area_and_name_from_name(parent_device[ATTR_CONTROL_STATION_NAME])
 
         info = {
             ATTR_IDENTIFIERS: {(DOMAIN, parent_device[ATTR_DEVICE_ID])},
@@ -200,11 +185,3 @@ class LutronCasetaButtonLED(BinarySensorEntity):
     @property
     def icon(self) -> str:
         return "mdi:led-on" if self.is_on else "mdi:led-off"
-
-
-def _button_area_and_name_from_name(device_name: str) -> tuple[str, str]:
-    """Return the area and name from the devices internal name."""
-    if "_" in device_name:
-        area_device_name = device_name.split("_", 1)
-        return area_device_name[0], area_device_name[1]
-    return UNASSIGNED_AREA, device_name
\ No newline at end of file
@@ -2,7 +2,6 @@
 
 from typing import Any, Dict
 import logging
-from collections.abc import Iterable
 
 from homeassistant.components.button import (
     ButtonEntity,
@@ -15,12 +14,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pylutron_caseta.smartbridge import Smartbridge
 
 from .models import LutronCasetaData
-from .util import serial_to_unique_id
+from .util import area_and_name_from_name, serial_to_unique_id
 
 from .const import DOMAIN as CASETA_DOMAIN
 from .const import (
     DOMAIN,
     MANUFACTURER,
+    SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN,
+    SEETOUCH_BUTTON_NAME_OVERRIDES,
     UNASSIGNED_AREA,
 )
 
@@ -28,13 +29,9 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_BUTTON_NAME = "button_name"
 ATTR_CONTROL_STATION_NAME = "control_station_name"
-ATTR_BUTTON_GROUPS = "button_groups"
 ATTR_BUTTON_GROUP = "button_group"
 ATTR_TYPE = "type"
 
-SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN = "Button "
-SEETOUCH_BUTTON_NAME_LOWER = "Button 18"
-SEETOUCH_BUTTON_NAME_RAISE = "Button 19"
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,13 +47,7 @@ async def async_setup_entry(
     bridge = data.bridge
     bridge_device = data.bridge_device
     buttons = bridge.buttons
-
-    button_group_to_device_map = {}
-    for device in bridge.devices.values():
-        if ATTR_BUTTON_GROUPS in device and isinstance(device[ATTR_BUTTON_GROUPS], Iterable):
-            for g in device[ATTR_BUTTON_GROUPS]:
-                if g not in button_group_to_device_map:
-                    button_group_to_device_map[g] = device
+    button_group_to_device_map = data.button_group_to_device_map
 
     button_entities = []
     for device_id in buttons:
@@ -90,25 +81,22 @@ class LutronCasetaButton(ButtonEntity):
         self.device_id = str(device[ATTR_DEVICE_ID])
 
         button_name = device[ATTR_BUTTON_NAME]
-        if button_name == SEETOUCH_BUTTON_NAME_LOWER:
-            button_name = "Lower"
-        elif button_name == SEETOUCH_BUTTON_NAME_RAISE:
-            button_name = "Raise"
-        
-        if SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN in button_name:
+        button_name = SEETOUCH_BUTTON_NAME_OVERRIDES.get(button_name, button_name)
+
+        if button_name.startswith(SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN):
             # Hide default buttons
             self._attr_entity_registry_enabled_default = False
         else:
             self._attr_entity_registry_enabled_default = True
 
         device_name = device[ATTR_NAME]
-        area, _ = _area_and_name_from_name(device_name)
+        area, _ = area_and_name_from_name(device_name)
 
         self.display_name = f"{area} {button_name}"
         self._attr_name = self.display_name
         self._attr_unique_id = self.device_id
 
-        parent_area, parent_name = _area_and_name_from_name(parent_device[ATTR_CONTROL_STATION_NAME])
+        parent_area, parent_name = area_and_name_from_name(parent_device[ATTR_CONTROL_STATION_NAME])
 
         info = {
             ATTR_IDENTIFIERS: {(DOMAIN, parent_device[ATTR_DEVICE_ID])},
@@ -128,10 +116,3 @@ class LutronCasetaButton(ButtonEntity):
     @property
     def name(self):
         return self.display_name
-
-def _area_and_name_from_name(device_name: str) -> tuple[str, str]:
-    """Return the area and name from the devices internal name."""
-    if "_" in device_name:
-        area_device_name = device_name.split("_", 1)
-        return area_device_name[0], area_device_name[1]
-    return UNASSIGNED_AREA, device_name
\ No newline at end of file
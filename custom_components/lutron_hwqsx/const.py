@@ -36,4 +36,16 @@ BRIDGE_TIMEOUT = 35
 
 UNASSIGNED_AREA = "Unassigned"
 
+SEETOUCH_BUTTON_NAME_DEFAULT_PATTERN = "Button "
+SEETOUCH_BUTTON_NAME_LOWER = "Button 18"
+SEETOUCH_BUTTON_NAME_RAISE = "Button 19"
+SEETOUCH_BUTTON_NAME_OVERRIDES = {
+    SEETOUCH_BUTTON_NAME_LOWER: "Lower",
+    SEETOUCH_BUTTON_NAME_RAISE: "Raise",
+}
+
+QSX_KEYPADS = frozenset(
+    {"SeeTouchHybridKeypad", "HomeownerKeypad", "SeeTouchTabletopKeypad", "Pico3ButtonRaiseLower"}
+)
+
 CONFIG_URL = "https://device-login.lutron.com"
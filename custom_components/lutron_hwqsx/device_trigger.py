@@ -35,13 +35,12 @@ from .const import (
     CONF_SUBTYPE,
     DOMAIN,
     LUTRON_CASETA_BUTTON_EVENT,
+    QSX_KEYPADS,
 )
 from .models import LutronCasetaData
 
 _LOGGER = logging.getLogger(__name__)
 
-QSX_KEYPADS = {'SeeTouchHybridKeypad', 'HomeownerKeypad', 'SeeTouchTabletopKeypad', "Pico3ButtonRaiseLower"}
-
 def _reverse_dict(forward_dict: dict) -> dict:
     """Reverse a dictionary."""
     return {v: k for k, v in forward_dict.items()}
@@ -429,7 +428,7 @@ async def async_validate_trigger_config(
     """Validate config."""
     # if device is available verify parameters against device capabilities
     device = get_button_device_by_dr_id(hass, config[CONF_DEVICE_ID])
-    _LOGGER.debug(f"async_validate_trigger_config: {device}, config={config}")
+    _LOGGER.debug("async_validate_trigger_config: %s, config=%s", device, config)
 
     if not device:
         return config
@@ -524,10 +523,16 @@ async def async_attach_trigger(
     _, serial = list(device.identifiers)[0]
     schema = DEVICE_TYPE_SCHEMA_MAP[device_type]
 
-    _LOGGER.debug(f"async_attach_trigger device:{device} device_type:{device_type}, serial:{serial}, schema:{schema}")
+    _LOGGER.debug(
+        "async_attach_trigger device:%s device_type:%s, serial:%s, schema:%s",
+        device,
+        device_type,
+        serial,
+        schema,
+    )
 
     if device_type in QSX_KEYPADS:
-        _LOGGER.debug(f"attaching trigger for QSX Keypad {serial}: {config}")
+        _LOGGER.debug("attaching trigger for QSX Keypad %s: %s", serial, config)
         event_config = {
             event_trigger.CONF_PLATFORM: CONF_EVENT,
             event_trigger.CONF_EVENT_TYPE: LUTRON_CASETA_BUTTON_EVENT,
@@ -538,7 +543,7 @@ async def async_attach_trigger(
             },
         }
     else:
-        _LOGGER.debug(f"attaching trigger for non-QSX Keypad {serial}: {config}")
+        _LOGGER.debug("attaching trigger for non-QSX Keypad %s: %s", serial, config)
         valid_buttons = DEVICE_TYPE_SUBTYPE_MAP_TO_LEAP[device_type]
         config = schema(config)
         event_config = {
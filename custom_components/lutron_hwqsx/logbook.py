@@ -16,6 +16,7 @@ from .const import (
     ATTR_TYPE,
     DOMAIN,
     LUTRON_CASETA_BUTTON_EVENT,
+    QSX_KEYPADS,
 )
 from .device_trigger import LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP
 
@@ -23,8 +24,6 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_BUTTON_NAME = "button_name"
 
-QSX_KEYPADS = {'SeeTouchHybridKeypad', 'HomeownerKeypad', 'SeeTouchTabletopKeypad', 'Pico3ButtonRaiseLower'}
-
 @callback
 def async_describe_events(
     hass: HomeAssistant,
@@ -36,18 +35,21 @@ def async_describe_events(
     def async_describe_button_event(event: Event) -> dict[str, str]:
         """Describe lutron_caseta_button_event logbook event."""
         data = event.data
-        device_type = data[ATTR_TYPE]            
+        device_type = data[ATTR_TYPE]
 
         if device_type in QSX_KEYPADS:
-            button_description = data.get(ATTR_BUTTON_NAME, f"button {data[ATTR_LEAP_BUTTON_NUMBER]}")
+            if (button_description := data.get(ATTR_BUTTON_NAME)) is None:
+                button_description = f"button {data[ATTR_LEAP_BUTTON_NUMBER]}"
         else:
-            leap_button_number = data[ATTR_LEAP_BUTTON_NUMBER]
-            button_map = LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP[device_type]
-            button_description = button_map[leap_button_number]
-        
+            button_description = LEAP_TO_DEVICE_TYPE_SUBTYPE_MAP[device_type][
+                data[ATTR_LEAP_BUTTON_NUMBER]
+            ]
+
+        entry_name = f"{data[ATTR_AREA_NAME]} {data[ATTR_DEVICE_NAME]}"
+        entry_message = f"{data[ATTR_ACTION]} {button_description}"
         return {
-            LOGBOOK_ENTRY_NAME: f"{data[ATTR_AREA_NAME]} {data[ATTR_DEVICE_NAME]}",
-            LOGBOOK_ENTRY_MESSAGE: f"{data[ATTR_ACTION]} {button_description}",
+            LOGBOOK_ENTRY_NAME: entry_name,
+            LOGBOOK_ENTRY_MESSAGE: entry_message,
         }
 
     async_describe_event(
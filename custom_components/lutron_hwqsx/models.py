@@ -13,4 +13,8 @@ class LutronCasetaData:
 
     bridge: Smartbridge
     bridge_device: dict[str, Any]
+    devices: dict[str, dict]
+    buttons: dict[str, dict]
+    occupancy_groups: dict[str, dict]
     button_devices: dict[str, dict]
+    button_group_to_device_map: dict[str, dict]
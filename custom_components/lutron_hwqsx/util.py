@@ -1,7 +1,20 @@
 """Support for Lutron Caseta."""
 from __future__ import annotations
 
+from functools import lru_cache
+
+from .const import UNASSIGNED_AREA
+
 
 def serial_to_unique_id(serial: int) -> str:
     """Convert a lutron serial number to a unique id."""
     return hex(serial)[2:].zfill(8)
+
+
+@lru_cache(maxsize=1024)
+def area_and_name_from_name(device_name: str) -> tuple[str, str]:
+    """Return the area and name from the devices internal name."""
+    area, sep, name = device_name.partition("_")
+    if sep:
+        return area, name
+    return UNASSIGNED_AREA, device_name
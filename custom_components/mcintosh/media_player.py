@@ -1,8 +1,10 @@
 """Support for McIntosh Network Receivers."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-import telnetlib
+import time
 
 import voluptuous as vol
 
@@ -23,6 +25,9 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_NAME = "DEFAULT AVR"
 
+TELNET_PORT = 23
+CONNECT_TIMEOUT = 2
+
 SUPPORT_MCINTOSH = (
     MediaPlayerEntityFeature.VOLUME_SET
     | MediaPlayerEntityFeature.VOLUME_MUTE
@@ -73,22 +78,35 @@ MEDIA_MODES = {
     "USB/IPOD": "USB/IPOD",
 }
 
+_MEDIA_SOURCE_SET = frozenset(MEDIA_MODES.values())
+# Lengths of the NSE0, NSE1X..NSE3X and NSE4..NSE8 answer prefixes
+_NSE_PREFIX_LENS = (4, 5, 5, 5, 4, 4, 4, 4, 4)
+_SUPPORT_MCINTOSH_WITH_MEDIA = SUPPORT_MCINTOSH | SUPPORT_MEDIA_MODES
+
 # Sub-modes of 'NET/USB'
 # {'USB': 'USB', 'iPod Direct': 'IPD', 'Internet Radio': 'IRP',
 #  'Favorites': 'FVP'}
 
 
-def setup_platform(
+def _reverse_sources(source_list: dict[str, str]) -> dict[str, str]:
+    """Map source codes back to the first pretty name that uses them."""
+    source_by_code: dict[str, str] = {}
+    for pretty_name, code in source_list.items():
+        source_by_code.setdefault(code, pretty_name)
+    return source_by_code
+
+
+async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
-    add_entities: AddEntitiesCallback,
+    async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the McIntosh platform."""
     mcintosh = McIntoshDevice(config[CONF_NAME], config[CONF_HOST])
 
-    if mcintosh.do_update():
-        add_entities([mcintosh])
+    if await mcintosh.async_do_update():
+        async_add_entities([mcintosh])
 
 
 class McIntoshDevice(MediaPlayerEntity):
@@ -115,24 +133,77 @@ class McIntoshDevice(MediaPlayerEntity):
         self._volume_max = 98
         self._source_list = NORMAL_INPUTS.copy()
         self._source_list.update(MEDIA_MODES)
+        self._sources_changed()
         self._muted = False
         self._mediasource = ""
         self._mediainfo = ""
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
 
         self._should_setup_sources = True
 
-    def _setup_sources(self, telnet):
-        _LOGGER.debug("_setup_sources: %s", telnet)
+    def _sources_changed(self) -> None:
+        """Refresh the lookups derived from _source_list."""
+        self._source_by_code = _reverse_sources(self._source_list)
+        self._sorted_sources: tuple[str, ...] = tuple(sorted(self._source_list))
+
+    async def _async_connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Return the open connection, connecting if needed."""
+        if (
+            self._reader is None
+            or self._writer is None
+            or self._writer.is_closing()
+            or self._reader.at_eof()
+        ):
+            await self._async_close()
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, TELNET_PORT), CONNECT_TIMEOUT
+            )
+        return self._reader, self._writer
+
+    async def _async_close(self) -> None:
+        """Close the connection, if any."""
+        if (writer := self._writer) is None:
+            return
+        self._reader = self._writer = None
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+    async def _async_run(self, func, *args):
+        """Run `func` on the shared connection, reconnecting once."""
+        async with self._lock:
+            try:
+                return await func(*await self._async_connect(), *args)
+            except (EOFError, OSError, asyncio.TimeoutError):
+                await self._async_close()
+                return await func(*await self._async_connect(), *args)
+
+    async def _async_request(self, command, all_lines=False):
+        """Send `command` over the shared connection and return the response."""
+        return await self._async_run(self.telnet_request, command, all_lines)
+
+    async def _async_send(self, command):
+        """Send `command` over the shared connection without waiting for a reply."""
+        await self._async_run(self.telnet_write, command)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the connection when the entity is removed."""
+        await self._async_close()
+
+    async def _async_setup_sources(self, reader, writer):
+        _LOGGER.debug("_setup_sources: %s", self._host)
         # NSFRN - Network name
         if self._name == DEFAULT_NAME:
-            nsfrn = self.telnet_request(telnet, "NSFRN ?")[len("NSFRN ") :]
+            nsfrn = (await self.telnet_request(reader, writer, "NSFRN ?")).removeprefix("NSFRN ")
             if nsfrn:
                 self._name = nsfrn
 
         # SSFUN - Configured sources with (optional) names
         self._source_list = {}
-        for line in self.telnet_request(telnet, "SSFUN ?", all_lines=True):
-            ssfun = line[len("SSFUN") :].split(" ", 1)
+        for line in await self.telnet_request(reader, writer, "SSFUN ?", all_lines=True):
+            ssfun = line.removeprefix("SSFUN").split(" ", 1)
             source = ssfun[0]
             if len(ssfun) == 2 and ssfun[1]:
                 configured_name = ssfun[1]
@@ -142,108 +213,159 @@ class McIntoshDevice(MediaPlayerEntity):
             if configured_name == "END":
                 continue
             self._source_list[configured_name] = source
+        self._sources_changed()
 
-        _LOGGER.debug(f"all sources: {self._source_list}")
+        _LOGGER.debug("all sources: %s", self._source_list)
 
         # SSSOD - Deleted sources
-        for line in self.telnet_request(telnet, "SSSOD ?", all_lines=True):
-            source, status = line[len("SSSOD") :].split(" ", 1)
-            if status == "DEL":
-                for pretty_name, name in self._source_list.items():
-                    if source == name:
-                        del self._source_list[pretty_name]
-                        break
+        deleted = {
+            line.removeprefix("SSSOD").split(" ", 1)[0]
+            for line in await self.telnet_request(reader, writer, "SSSOD ?", all_lines=True)
+            if line.endswith(" DEL")
+        }
+        if deleted:
+            self._source_list = {
+                pretty_name: source
+                for pretty_name, source in self._source_list.items()
+                if source not in deleted
+            }
+            self._sources_changed()
 
     @classmethod
-    def telnet_request(cls, telnet, command, all_lines=False):
-        """Execute `command` and return the response."""
+    async def discard_pending(cls, reader):
+        """Drop anything already buffered, such as echoes of earlier commands."""
+        while True:
+            try:
+                async with asyncio.timeout(0):
+                    data = await reader.read(1024)
+            except asyncio.TimeoutError:
+                return
+            if not data:
+                return
+            _LOGGER.debug("Discarding: %s", data)
+
+    @classmethod
+    async def telnet_write(cls, reader, writer, command):
+        """Send `command` without reading the response."""
+        await cls.discard_pending(reader)
         _LOGGER.debug("Sending: %s", command)
-        telnet.write(command.encode("ASCII") + b"\r")
+        writer.write(command.encode("ASCII") + b"\r")
+        await writer.drain()
+
+    @classmethod
+    async def telnet_request(cls, reader, writer, command, all_lines=False):
+        """Execute `command` and return the response."""
+        await cls.telnet_write(reader, writer, command)
         lines = []
         while True:
-            line = telnet.read_until(b"\r", timeout=0.2)
-            if not line:
+            try:
+                line = await asyncio.wait_for(reader.readuntil(b"\r"), 0.2)
+            except asyncio.TimeoutError:
                 break
-            lines.append(line.decode("ASCII").strip())
             _LOGGER.debug("Received: %s", line)
+            # Skip unread echoes of earlier commands sent with telnet_write
+            if (line := line.decode("ASCII").strip())[:2] == command[:2]:
+                lines.append(line)
 
         if all_lines:
             return lines
-        return lines[0] if lines else ""
+        # Earlier lines may be stale echoes or unsolicited status updates
+        return lines[-1] if lines else ""
 
     @classmethod
-    def get_telnet_response(cls, telnet, cmd, is_prefixed, default):
-        if (
-            response := cls.telnet_request(telnet, f"{cmd}?")
-        ) and response.startswith(cmd):
-            if is_prefixed:
-                return response[len(cmd) :]
-            else:
-                return response
-        else:
-            _LOGGER.debug(f"get_telnet_response({cmd}?)={response}, returning default={default}")
-            return default
-
-    def telnet_command(self, command):
-        """Establish a telnet connection and sends `command`."""
-        telnet = telnetlib.Telnet(self._host)
-        _LOGGER.debug("Sending: %s", command)
-        telnet.write(command.encode("ASCII") + b"\r")
-        telnet.read_very_eager()  # skip response
-        telnet.close()
-
-    def update(self) -> None:
+    async def telnet_multi_request(cls, reader, writer, commands, total_timeout=0.5):
+        """Send all `commands` in one write and return the responses.
+
+        The response lines are grouped by their two letter prefix.
+        """
+        await cls.discard_pending(reader)
+        _LOGGER.debug("Sending: %s", commands)
+        writer.write(b"".join(command.encode("ASCII") + b"\r" for command in commands))
+        await writer.drain()
+        deadline = time.monotonic() + total_timeout
+        data = b""
+        while (remaining := deadline - time.monotonic()) > 0:
+            # Once the device has started answering, stop after 50ms of silence
+            wait = min(remaining, 0.05) if data else remaining
+            try:
+                chunk = await asyncio.wait_for(reader.read(1024), wait)
+            except asyncio.TimeoutError:
+                if data:
+                    break
+                continue
+            if not chunk:
+                raise EOFError
+            data += chunk
+        _LOGGER.debug("Received: %s", data)
+
+        responses: dict[str, list[str]] = {}
+        for line in data.decode("ASCII").split("\r"):
+            if line := line.strip():
+                responses.setdefault(line[:2], []).append(line)
+        return responses
+
+    async def async_telnet_command(self, command):
+        """Send `command` over the shared connection, ignoring the response."""
+        await self._async_send(command)
+
+    async def async_update(self) -> None:
         """Get the latest details from the device."""
         _LOGGER.debug("update: %s", self)
-        self.do_update()
+        await self.async_do_update()
 
-    def do_update(self) -> bool:
+    async def async_do_update(self) -> bool:
         """Get the latest details from the device, as boolean."""
         _LOGGER.debug("do_update: %s", self)
-        try:
-            telnet = telnetlib.Telnet(self._host)
-        except OSError:
-            _LOGGER.error("OSError from do_update")
-            return False
-
+        async with self._lock:
+            for attempt in range(2):
+                try:
+                    await self._async_update_from(*await self._async_connect())
+                    return True
+                except (EOFError, OSError, asyncio.TimeoutError):
+                    await self._async_close()
+                    if attempt:
+                        _LOGGER.error("OSError from do_update")
+        return False
+
+    async def _async_update_from(self, reader, writer) -> None:
+        """Query the device state over the given connection."""
         if self._should_setup_sources:
-            self._setup_sources(telnet)
+            await self._async_setup_sources(reader, writer)
             self._should_setup_sources = False
 
-        self._pwstate = self.get_telnet_response(telnet, "PW", False, self._pwstate)
-        self.handle_volume_response(self.telnet_request(telnet, "MV?", all_lines=True))
-        self._muted = self.get_telnet_response(telnet, "MU", False, self._muted) == "MUON"
-        self._mediasource = self.get_telnet_response(telnet, "SI", True, self._mediasource)
-
-        if self._mediasource in MEDIA_MODES.values():
-            self._mediainfo = ""
-            answer_codes = [
-                "NSE0",
-                "NSE1X",
-                "NSE2X",
-                "NSE3X",
-                "NSE4",
-                "NSE5",
-                "NSE6",
-                "NSE7",
-                "NSE8",
+        responses = await self.telnet_multi_request(
+            reader, writer, ("PW?", "MV?", "MU?", "SI?")
+        )
+        # The last line of each kind is the most recent state
+        if pw_lines := responses.get("PW"):
+            self._pwstate = pw_lines[-1]
+        self.handle_volume_response(responses.get("MV", ()))
+        if mu_lines := responses.get("MU"):
+            self._muted = mu_lines[-1] == "MUON"
+        if si_lines := responses.get("SI"):
+            self._mediasource = si_lines[-1].removeprefix("SI")
+
+        if self._mediasource in _MEDIA_SOURCE_SET:
+            lines = [
+                line
+                for line in await self.telnet_request(reader, writer, "NSE", all_lines=True)
+                # Skip unread replies to the NS9x transport commands
+                if line.startswith("NSE")
             ]
-            for line in self.telnet_request(telnet, "NSE", all_lines=True):
-                self._mediainfo += f"{line[len(answer_codes.pop(0)) :]}\n"
+            self._mediainfo = "".join(
+                f"{line[prefix_len:]}\n"
+                for line, prefix_len in zip(lines, _NSE_PREFIX_LENS)
+            )
         else:
             self._mediainfo = self.source
 
-        telnet.close()
-        return True
-
     def handle_volume_response(self, response) -> int:
         for line in response:
             # only grab two digit max, don't care about any half digit
             if line.startswith("MVMAX "):
-                self._volume_max = int(line[len("MVMAX ") : len("MVMAX XX")])
-                continue
+                self._volume_max = int(line.removeprefix("MVMAX ")[:2])
             elif line.startswith("MV"):
-                self._volume = int(line[len("MV") : len("MVXX")])
+                self._volume = int(line.removeprefix("MV")[:2])
         return self._volume
 
     @property
@@ -254,7 +376,7 @@ class McIntoshDevice(MediaPlayerEntity):
     @property
     def state(self) -> MediaPlayerState | None:
         """Return the state of the device."""
-        _LOGGER.debug(f"state(): {self._pwstate}")
+        _LOGGER.debug("state(): %s", self._pwstate)
         if self._pwstate == "PWSTANDBY":
             return MediaPlayerState.OFF
         elif self._pwstate == "PWON":
@@ -265,7 +387,7 @@ class McIntoshDevice(MediaPlayerEntity):
     @property
     def volume_level(self):
         """Volume level of the media player (0..1)."""
-        _LOGGER.debug(f"volume_level(): {self._volume} / {self._volume_max}")
+        _LOGGER.debug("volume_level(): %s / %s", self._volume, self._volume_max)
         return self._volume / self._volume_max
 
     @property
@@ -276,7 +398,7 @@ class McIntoshDevice(MediaPlayerEntity):
     @property
     def source_list(self):
         """Return the list of available input sources."""
-        return sorted(self._source_list)
+        return self._sorted_sources
 
     @property
     def media_title(self):
@@ -286,79 +408,66 @@ class McIntoshDevice(MediaPlayerEntity):
     @property
     def supported_features(self):
         """Flag media player features that are supported."""
-        if self._mediasource in MEDIA_MODES.values():
-            return SUPPORT_MCINTOSH | SUPPORT_MEDIA_MODES
+        if self._mediasource in _MEDIA_SOURCE_SET:
+            return _SUPPORT_MCINTOSH_WITH_MEDIA
         return SUPPORT_MCINTOSH
 
     @property
     def source(self):
         """Return the current input source."""
-        for pretty_name, name in self._source_list.items():
-            if self._mediasource == name:
-                return pretty_name
+        return self._source_by_code.get(self._mediasource)
 
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn the media player on."""
-        telnet = telnetlib.Telnet(self._host)
         self._pwstate = "PWON"
-        self._pwstate = self.telnet_request(telnet, "PWON")
+        self._pwstate = await self._async_request("PWON")
 
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn off media player."""
-        telnet = telnetlib.Telnet(self._host)
         self._pwstate = "PWSTANDBY"
-        self._pwstate = self.telnet_request(telnet, "PWSTANDBY")
+        self._pwstate = await self._async_request("PWSTANDBY")
 
-    def select_source(self, source: str) -> None:
+    async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        telnet = telnetlib.Telnet(self._host)
         updated_source = self._source_list.get(source)
-        self._mediasource = source
-        self._mediasource = self.telnet_request(telnet, f"SI{updated_source}")[2 :]
+        await self._async_send(f"SI{updated_source}")
+        self._mediasource = updated_source
 
-    def set_volume_level(self, volume: float) -> None:
+    async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        telnet = telnetlib.Telnet(self._host)
         self._volume = round(volume * self._volume_max)
-        self.handle_volume_response(
-            self.telnet_request(telnet, f"MV{self._volume:02}", all_lines=True))
+        await self._async_send(f"MV{self._volume:02}")
 
-    def volume_up(self) -> None:
+    async def async_volume_up(self) -> None:
         """Volume up media player."""
-        telnet = telnetlib.Telnet(self._host)
-        self.handle_volume_response(
-            self.telnet_request(telnet, "MVUP", all_lines=True))
+        self.handle_volume_response(await self._async_request("MVUP", all_lines=True))
 
-    def volume_down(self) -> None:
+    async def async_volume_down(self) -> None:
         """Volume down media player."""
-        telnet = telnetlib.Telnet(self._host)
-        self.handle_volume_response(
-            self.telnet_request(telnet, "MVDOWN", all_lines=True))
+        self.handle_volume_response(await self._async_request("MVDOWN", all_lines=True))
 
-    def mute_volume(self, mute: bool) -> None:
+    async def async_mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
-        telnet = telnetlib.Telnet(self._host)
-
         mute_status = "ON" if mute else "OFF"
         self._muted = mute
-        self._muted = self.telnet_request(telnet, f"MU{mute_status}") == "MUON"
+        self._muted = await self._async_request(f"MU{mute_status}") == "MUON"
 
-    def media_play(self) -> None:
+    async def async_media_play(self) -> None:
         """Play media player."""
-        self.telnet_command("NS9A")
+        await self.async_telnet_command("NS9A")
 
-    def media_pause(self) -> None:
+    async def async_media_pause(self) -> None:
         """Pause media player."""
-        self.telnet_command("NS9B")
+        await self.async_telnet_command("NS9B")
 
-    def media_stop(self) -> None:
+    async def async_media_stop(self) -> None:
         """Pause media player."""
-        self.telnet_command("NS9C")
+        await self.async_telnet_command("NS9C")
 
-    def media_next_track(self) -> None:
+    async def async_media_next_track(self) -> None:
         """Send the next track command."""
-        self.telnet_command("NS9D")
+        await self.async_telnet_command("NS9D")
 
-    def media_previous_track(self) -> None:
+    async def async_media_previous_track(self) -> None:
         """Send the previous track command."""
-        self.telnet_command("NS9E")
\ No newline at end of file
+        await self.async_telnet_command("NS9E")
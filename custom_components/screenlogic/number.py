@@ -17,13 +17,14 @@ from .api.request import async_make_request
 
 SETPUMPFLOW_QUERY = 12586
 SETPUMPFLOW_ANSWER = SETPUMPFLOW_QUERY + 1
+_SETPUMPFLOW_PACK = struct.Struct("<IIIII").pack
 
 async def async_request_set_pump_flow(
     protocol: ScreenLogicProtocol, body: int, pumpID: int, flow: int, isRPMs: bool
 ) -> bool:
     return (
         await async_make_request(
-            protocol, SETPUMPFLOW_QUERY, struct.pack("<IIIII", 0, pumpID, body, flow, isRPMs)
+            protocol, SETPUMPFLOW_QUERY, _SETPUMPFLOW_PACK(0, pumpID, body, flow, int(isRPMs))
         )
         == b""
     )
@@ -32,10 +33,13 @@ _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 1
 
-SUPPORTED_SCG_NUMBERS = (
-    "scg_level1",
-    "scg_level2",
-)
+_SCG_INDEX = {
+    "scg_level1": 0,
+    "scg_level2": 1,
+}
+SUPPORTED_SCG_NUMBERS = tuple(_SCG_INDEX)
+_POOL_KEY = SUPPORTED_SCG_NUMBERS[BODY_TYPE.POOL]
+_SPA_KEY = SUPPORTED_SCG_NUMBERS[BODY_TYPE.SPA]
 
 PUMP_TYPE_UNITS = {
     1: "gpm",
@@ -53,6 +57,9 @@ PUMP_DATA_STATE_KEY = "state"
 PUMP_DATA_CURRENT_WATTS_KEY = "currentWatts"
 PUMP_DATA_PRESETS_KEY = "presets"
 
+# (min, max) pump flow keyed by isRPMs
+_PUMP_FLOW_BOUNDS = {True: (1000, 3450), False: (20, 90)}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -67,8 +74,8 @@ async def async_setup_entry(
         async_add_entities(
             [
                 ScreenLogicNumber(coordinator, scg_level)
-                for scg_level in coordinator.data[SL_DATA.KEY_SCG]
-                if scg_level in SUPPORTED_SCG_NUMBERS
+                for scg_level in SUPPORTED_SCG_NUMBERS
+                if scg_level in coordinator.data[SL_DATA.KEY_SCG]
             ]
         )
 
@@ -111,19 +118,18 @@ class ScreenLogicPumpPreset(ScreenlogicEntity, NumberEntity):
         full_preset_name = f"{self.gateway_name} {pump_data[PUMP_DATA_NAME_KEY]} {preset_name} Preset"
 
         if flow_type == "gpm":
-            self._attr_native_min_value = 20
-            self._attr_native_max_value = 90
             self._attr_native_step = 1
             self._attr_name = f"{full_preset_name} (GPM)"
             self._attr_native_unit_of_measurement = "gal/min"
             self.isRPMs = False
         else:
-            self._attr_native_min_value = 1000
-            self._attr_native_max_value = 3450
             self._attr_native_step = 10
             self._attr_name = f"{full_preset_name} (RPM)"
             self._attr_native_unit_of_measurement = "rpm"
             self.isRPMs = True
+        self._attr_native_min_value, self._attr_native_max_value = _PUMP_FLOW_BOUNDS[
+            self.isRPMs
+        ]
 
     @property
     def native_value(self) -> float:
@@ -132,7 +138,8 @@ class ScreenLogicPumpPreset(ScreenlogicEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        _LOGGER.debug(f"PumpFlow SET: {int(value)} vs {self.native_value}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("PumpFlow SET: %i vs %s", value, self.native_value)
         await self.async_set_preset(self._preset_id, self._pump_id, int(value), self.isRPMs)
         # Update pumps
         await self._async_refresh()
@@ -152,12 +159,7 @@ class ScreenLogicPumpPreset(ScreenlogicEntity, NumberEntity):
         return False
 
     def _is_valid_pumpflow(self, flow, isRPMs):
-        if isRPMs:
-            min_flow = 1000
-            max_flow = 3450
-        else:
-            min_flow = 20
-            max_flow = 90
+        min_flow, max_flow = _PUMP_FLOW_BOUNDS[isRPMs]
         return min_flow <= flow <= max_flow
 
     def _is_valid_preset(self, preset):
@@ -188,7 +190,7 @@ class ScreenLogicNumber(ScreenlogicEntity, NumberEntity):
     def __init__(self, coordinator, data_key, enabled=True):
         """Initialize of the entity."""
         super().__init__(coordinator, data_key, enabled)
-        self._body_type = SUPPORTED_SCG_NUMBERS.index(self._data_key)
+        self._body_type = _SCG_INDEX[self._data_key]
         self._attr_native_max_value = SCG.LIMIT_FOR_BODY[self._body_type]
         self._attr_name = f"{self.gateway_name} {self.sensor['name']}"
         self._attr_native_unit_of_measurement = self.sensor["unit"]
@@ -200,29 +202,17 @@ class ScreenLogicNumber(ScreenlogicEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        # Need to set both levels at the same time, so we gather
-        # both existing level values and override the one that changed.
-        levels = {}
-        for level in SUPPORTED_SCG_NUMBERS:
-            levels[level] = self.coordinator.data[SL_DATA.KEY_SCG][level]["value"]
-        levels[self._data_key] = int(value)
-
-        if await self.coordinator.gateway.async_set_scg_config(
-            levels[SUPPORTED_SCG_NUMBERS[BODY_TYPE.POOL]],
-            levels[SUPPORTED_SCG_NUMBERS[BODY_TYPE.SPA]],
-        ):
-            _LOGGER.debug(
-                "Set SCG to %i, %i",
-                levels[SUPPORTED_SCG_NUMBERS[BODY_TYPE.POOL]],
-                levels[SUPPORTED_SCG_NUMBERS[BODY_TYPE.SPA]],
-            )
+        # Need to set both levels at the same time, so we use the
+        # existing level value for the body that did not change.
+        scg = self.coordinator.data[SL_DATA.KEY_SCG]
+        pool = int(value) if self._data_key == _POOL_KEY else scg[_POOL_KEY]["value"]
+        spa = int(value) if self._data_key == _SPA_KEY else scg[_SPA_KEY]["value"]
+
+        if await self.coordinator.gateway.async_set_scg_config(pool, spa):
+            _LOGGER.debug("Set SCG to %i, %i", pool, spa)
             await self._async_refresh()
         else:
-            _LOGGER.warning(
-                "Failed to set_scg to %i, %i",
-                levels[SUPPORTED_SCG_NUMBERS[BODY_TYPE.POOL]],
-                levels[SUPPORTED_SCG_NUMBERS[BODY_TYPE.SPA]],
-            )
+            _LOGGER.warning("Failed to set_scg to %i, %i", pool, spa)
 
     @property
     def sensor(self) -> dict: